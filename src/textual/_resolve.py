@@ -3,6 +3,7 @@ from __future__ import annotations
 import sys
 from fractions import Fraction
 from itertools import accumulate
+from math import gcd
 from typing import cast, Sequence, TYPE_CHECKING
 
 from .box_model import BoxModel
@@ -39,46 +40,78 @@ def resolve(
         list[tuple[int, int]]: List of (<OFFSET>, <LENGTH>)
     """
 
-    resolved: list[tuple[Scalar, Fraction | None]] = [
-        (
-            (scalar, None)
-            if scalar.is_fraction
-            else (scalar, scalar.resolve(size, viewport))
-        )
-        for scalar in dimensions
-    ]
-
-    from_float = Fraction.from_float
-    total_fraction = from_float(
-        sum(scalar.value for scalar, fraction in resolved if fraction is None)
-    )
-
-    if total_fraction:
-        total_gutter = gutter * (len(dimensions) - 1)
-        consumed = sum(fraction for _, fraction in resolved if fraction is not None)
-        remaining = max(Fraction(0), Fraction(total - total_gutter) - consumed)
-        fraction_unit = Fraction(remaining, total_fraction)
-        resolved_fractions = [
-            from_float(scalar.value) * fraction_unit if fraction is None else fraction
-            for scalar, fraction in resolved
+    if not any(scalar.is_fraction for scalar in dimensions):
+        # Fast path: no fractional dimensions, so there is no remaining
+        # space to divide up and every scalar resolves directly.
+        resolved_fractions: list[Fraction] = [
+            scalar.resolve(size, viewport) for scalar in dimensions
         ]
     else:
-        resolved_fractions = cast(
-            "list[Fraction]", [fraction for _, fraction in resolved]
-        )
+        resolved: list[tuple[Scalar, Fraction | None]] = [
+            (
+                (scalar, None)
+                if scalar.is_fraction
+                else (scalar, scalar.resolve(size, viewport))
+            )
+            for scalar in dimensions
+        ]
+
+        total_fraction_value = 0.0
+        consumed = Fraction(0)
+        for scalar, fraction in resolved:
+            if fraction is None:
+                total_fraction_value += scalar.value
+            else:
+                consumed += fraction
+        total_fraction = Fraction.from_float(total_fraction_value)
+
+        if total_fraction:
+            total_gutter = gutter * (len(dimensions) - 1)
+            remaining = max(Fraction(0), Fraction(total - total_gutter) - consumed)
+            fraction_unit = Fraction(remaining, total_fraction)
+            unit_numerator = fraction_unit.numerator
+            unit_denominator = fraction_unit.denominator
+            resolved_fractions = []
+            add_fraction = resolved_fractions.append
+            for scalar, fraction in resolved:
+                if fraction is None:
+                    value_numerator, value_denominator = scalar.value.as_integer_ratio()
+                    add_fraction(
+                        Fraction(
+                            value_numerator * unit_numerator,
+                            value_denominator * unit_denominator,
+                        )
+                    )
+                else:
+                    add_fraction(fraction)
+        else:
+            resolved_fractions = cast(
+                "list[Fraction]", [fraction for _, fraction in resolved]
+            )
 
-    fraction_gutter = Fraction(gutter)
+    # Put everything over a common denominator, so that the cumulative sums
+    # may be done with integer arithmetic (much faster than Fraction).
+    denominator = 1
+    for fraction in resolved_fractions:
+        fraction_denominator = fraction.denominator
+        if denominator % fraction_denominator:
+            denominator = (
+                denominator
+                * fraction_denominator
+                // gcd(denominator, fraction_denominator)
+            )
+    scaled_gutter = gutter * denominator
+    scaled_values = [scaled_gutter] * (len(resolved_fractions) * 2)
+    scaled_values[::2] = [
+        fraction.numerator * (denominator // fraction.denominator)
+        for fraction in resolved_fractions
+    ]
     offsets = [0] + [
-        int(fraction)
-        for fraction in accumulate(
-            value
-            for fraction in resolved_fractions
-            for value in (fraction, fraction_gutter)
-        )
+        scaled_offset // denominator for scaled_offset in accumulate(scaled_values)
     ]
     results = [
-        (offset1, offset2 - offset1)
-        for offset1, offset2 in zip(offsets[::2], offsets[1::2])
+        (offsets[index], offsets[index + 1] - offsets[index])
+        for index in range(0, len(offsets) - 1, 2)
     ]
 
     return results
@@ -156,6 +156,8 @@ def _resolve_view_height(
     return Fraction(value) * Fraction(viewport.height, 100)
 
 
+_FRACTION_ONE = Fraction(1)
+
 RESOLVE_MAP = {
     Unit.CELLS: _resolve_cells,
     Unit.FRACTION: _resolve_fraction,
@@ -289,7 +291,7 @@ class Scalar(NamedTuple):
             unit = percent_unit
         try:
             dimension = RESOLVE_MAP[unit](
-                value, size, viewport, fraction_unit or Fraction(1)
+                value, size, viewport, fraction_unit or _FRACTION_ONE
             )
         except KeyError:
             raise ScalarResolveError(f"expected dimensions; found {str(self)!r}")